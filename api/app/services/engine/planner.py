@@ -2,7 +2,7 @@
 Planner: Select next skill based on learning progress.
 """
 
-from .skills import SKILLS, SKILL_BY_ID
+from .skills import SKILLS, SKILL_BY_ID, DEPENDENTS_BY_PREREQ
 
 
 def select_next_skill(state: dict) -> str:
@@ -34,17 +34,16 @@ def select_next_skill(state: dict) -> str:
         
         # If this skill has 3+ correct, find a skill to rotate to
         if streak >= 3:
-            for candidate in SKILLS:
+            # Only skills that list the current skill as a prerequisite
+            for candidate in DEPENDENTS_BY_PREREQ.get(sid, []):
                 cid = candidate["id"]
                 
                 # Skip if already rotated to this skill
                 if cid == last_selected:
                     continue
                 
-                # Check if current skill is a prerequisite for candidate
-                if sid in candidate.get("prereqs", []):
-                    # Found a valid rotation target
-                    return cid
+                # Found a valid rotation target
+                return cid
     
     # No rotation triggered - stay on last skill or pick first one
     if last_selected:
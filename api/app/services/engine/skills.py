@@ -38,6 +38,18 @@ SKILLS = [
 SKILL_BY_ID = {s["id"]: s for s in SKILLS}
 
 
+def _index_dependents(skills: list) -> dict:
+    """Map each prerequisite skill_id to the skills that require it (in SKILLS order)."""
+    index = {}
+    for skill in skills:
+        for prereq in skill.get("prereqs", []):
+            index.setdefault(prereq, []).append(skill)
+    return index
+
+
+DEPENDENTS_BY_PREREQ = _index_dependents(SKILLS)
+
+
 def get_skill(skill_id: str) -> dict:
     """Get skill definition by ID."""
     return SKILL_BY_ID.get(skill_id)
@@ -10,7 +10,7 @@ from __future__ import annotations
 from collections import OrderedDict
 from typing import Dict, Set, Tuple
 import asyncio
-import time
+import itertools
 
 
 PoolKey = Tuple[str, str, str]  # (session_id, skill_id, difficulty)
@@ -25,7 +25,8 @@ class LRUSeenBags:
     def __init__(self, max_entries: int = 1000):
         self.max_entries = max_entries
         self._bags: Dict[PoolKey, Set[str]] = {}
-        self._lru: OrderedDict[PoolKey, float] = OrderedDict()
+        self._lru: OrderedDict[PoolKey, int] = OrderedDict()
+        self._seq = itertools.count()
         self._lock = asyncio.Lock()
 
     async def mark_seen(self, key: PoolKey, stem: str) -> None:
@@ -62,11 +63,10 @@ class LRUSeenBags:
                 self._bags.pop(old_key, None)
 
     def _touch(self, key: PoolKey) -> None:
-        """Update LRU timestamp for this key."""
-        now = time.time()
+        """Update LRU position for this key (monotonic sequence, no clock read)."""
         if key in self._lru:
             self._lru.move_to_end(key)
-        self._lru[key] = now
+        self._lru[key] = next(self._seq)
 
 
 # Singleton for the app lifetime
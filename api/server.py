@@ -10,6 +10,7 @@ import sys
 import json
 import time
 import asyncio
+import itertools
 import contextlib
 import tempfile
 from pathlib import Path
@@ -126,6 +127,7 @@ class LRUSeenBags:
         self.max_entries = max_entries
         self._bags: dict = {}
         self._lru: OrderedDict = OrderedDict()
+        self._seq = itertools.count()
         self._lock = asyncio.Lock()
 
     async def mark_seen(self, key: PoolKey, stem: str) -> None:
@@ -154,11 +156,10 @@ class LRUSeenBags:
             self._touch(key)
 
     def _touch(self, key: PoolKey) -> None:
-        """Update LRU timestamp for this key."""
-        now = time.time()
+        """Update LRU position for this key (monotonic sequence, no clock read)."""
         if key in self._lru:
             self._lru.move_to_end(key)
-        self._lru[key] = now
+        self._lru[key] = next(self._seq)
 
 
 # Singleton for the app lifetime
@@ -362,13 +363,13 @@ async def generate_item_endpoint(request: GenerateItemRequest):
     # Fast path: random mode (unchanged)
     if request.mode != "cycle":
         try:
-            t0 = time.time()
+            t0 = time.perf_counter_ns()
             item = generate_item(
                 skill_id=request.skill_id,
                 difficulty=request.difficulty,
                 seed=request.seed,
             )
-            latency_ms = float((time.time() - t0) * 1000.0)
+            latency_ms = (time.perf_counter_ns() - t0) / 1e6
             
             # Log telemetry (async, don't await in sync path; fire-and-forget)
             try:
@@ -435,7 +436,7 @@ async def generate_item_endpoint(request: GenerateItemRequest):
         )
     
     # Cycle mode logic
-    t0 = time.time()
+    t0 = time.perf_counter_ns()
     pool_key = (request.session_id, request.skill_id, difficulty)  # type: ignore
     pool_size = len(pool)
     
@@ -469,7 +470,7 @@ async def generate_item_endpoint(request: GenerateItemRequest):
         if not await cycle_bags.has_seen(pool_key, stem):
             # Found an unseen stem
             await cycle_bags.mark_seen(pool_key, stem)
-            latency_ms = float((time.time() - t0) * 1000.0)
+            latency_ms = (time.perf_counter_ns() - t0) / 1e6
             
             # Log telemetry
             try:
@@ -511,7 +512,7 @@ async def generate_item_endpoint(request: GenerateItemRequest):
     )
     stem = item.get("stem", "")
     await cycle_bags.mark_seen(pool_key, stem)
-    latency_ms = float((time.time() - t0) * 1000.0)
+    latency_ms = (time.perf_counter_ns() - t0) / 1e6
     
     # Log telemetry (fallback case)
     try:
@@ -590,9 +591,9 @@ async def grade_endpoint(request: GradeRequest):
         )
     
     try:
-        t0 = time.time()
+        t0 = time.perf_counter_ns()
         result = grade_response(item=request.item, choice_id=request.choice_id)
-        latency_ms = float((time.time() - t0) * 1000.0)
+        latency_ms = (time.perf_counter_ns() - t0) / 1e6
         
         # NEW: Update mastery if session_id and skill_id are provided
         session_id = request.session_id or "anon"
@@ -648,7 +649,9 @@ async def grade_endpoint(request: GradeRequest):
             )
         elif error_msg.startswith("invalid_item"):
             # Extract error code if propagated: "invalid_item:<code>"
-            error_code = error_msg.split(":")[1] if ":" in error_msg else "unknown"
+            _, sep, error_code = error_msg.partition(":")
+            if not sep:
+                error_code = "unknown"
             raise HTTPException(
                 status_code=400,
                 detail={"error": "invalid_item", "message": f"Item validation failed: {error_code}"}
@@ -674,6 +677,13 @@ async def healthz():
     return {"status": "ok"}
 
 
+# Template pools are fixed at import, so the manifest is built once.
+_SKILLS_MANIFEST: Dict[str, Dict[str, int]] = {
+    skill_id: {difficulty: len(templates) for difficulty, templates in skill_templates.items()}
+    for skill_id, skill_templates in SKILL_TEMPLATES.items()
+}
+
+
 @app.get("/skills/manifest")
 async def skills_manifest() -> Dict[str, Dict[str, int]]:
     """
@@ -687,10 +697,7 @@ async def skills_manifest() -> Dict[str, Dict[str, int]]:
             ...
         }
     """
-    return {
-        skill_id: {difficulty: len(templates) for difficulty, templates in skill_templates.items()}
-        for skill_id, skill_templates in SKILL_TEMPLATES.items()
-    }
+    return _SKILLS_MANIFEST
 
 
 # ============================================================================
@@ -8,6 +8,8 @@ NOTE: Do not mutate `item`; grader must remain pure.
 
 from engine.validators import validate_item
 
+_VALID_CHOICE_IDS = frozenset({"A", "B", "C", "D"})
+
 
 def grade_response(item: dict, choice_id: str) -> dict:
     """
@@ -28,7 +30,7 @@ def grade_response(item: dict, choice_id: str) -> dict:
         ValueError("invalid_item:<error_code>"): If item fails validation
     """
     # Validate choice_id type and value (strict)
-    if not isinstance(choice_id, str) or len(choice_id) != 1 or choice_id not in ["A", "B", "C", "D"]:
+    if not isinstance(choice_id, str) or choice_id not in _VALID_CHOICE_IDS:
         raise ValueError("invalid_choice_id")
 
     # Validate item structure, propagate error code for debuggability
@@ -39,15 +41,15 @@ def grade_response(item: dict, choice_id: str) -> dict:
     # Determine if answer is correct
     correct = (choice_id == item["solution_choice_id"])
 
-    # Get choice texts for explanation
-    student_choice = next(c for c in item["choices"] if c["id"] == choice_id)
-    correct_choice = next(c for c in item["choices"] if c["id"] == item["solution_choice_id"])
+    # Get choice texts for explanation (one pass over the choices)
+    text_by_id = {c["id"]: c["text"] for c in item["choices"]}
+    correct_text = text_by_id[item["solution_choice_id"]]
 
     # Build pedagogical explanation
     if correct:
-        explanation = f"Correct! The answer is {correct_choice['text']}."
+        explanation = f"Correct! The answer is {correct_text}."
     else:
-        explanation = f"Not quite. The correct answer is {correct_choice['text']}, not {student_choice['text']}."
+        explanation = f"Not quite. The correct answer is {correct_text}, not {text_by_id[choice_id]}."
 
     return {
         "correct": correct,
@@ -19,7 +19,7 @@ from dataclasses import dataclass
 from typing import Dict, Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SkillMastery:
     """Immutable mastery state for a single skill."""
 
@@ -34,6 +34,10 @@ def _clamp(x: float, lo: float = 0.0, hi: float = 1.0) -> float:
     return lo if x < lo else hi if x > hi else x
 
 
+# Confidence scaling: 1→0.70, 2→0.85, 3→1.00, 4→1.15, 5→1.30
+_CONFIDENCE_FACTOR: Dict[int, float] = {c: 1.0 + (c - 3) * 0.15 for c in range(1, 6)}
+
+
 def update_progress(
     state: Dict[str, SkillMastery],
     skill_id: str,
@@ -66,7 +70,7 @@ def update_progress(
     Raises:
         ValueError("invalid_confidence") if confidence not in 1..5 (when provided)
     """
-    if confidence is not None and not (1 <= confidence <= 5):
+    if confidence is not None and confidence not in _CONFIDENCE_FACTOR:
         raise ValueError("invalid_confidence")
 
     # Pull existing mastery or defaults
@@ -75,10 +79,7 @@ def update_progress(
     # Base deltas
     base_delta = 0.08 if correct else -0.06
 
-    # Confidence scaling: 1→0.70, 2→0.85, 3→1.00, 4→1.15, 5→1.30
-    factor = 1.0
-    if confidence is not None:
-        factor = 1.0 + (confidence - 3) * 0.15
+    factor = 1.0 if confidence is None else _CONFIDENCE_FACTOR[confidence]
 
     # Update p with clamp
     new_p = _clamp(prev.p + base_delta * factor)
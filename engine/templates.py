@@ -341,6 +341,9 @@ SKILL_TEMPLATES = {
 
 VALID_DIFFICULTIES = {"easy", "medium", "hard", "applied"}
 
+# Display IDs for choices, by position after shuffling
+_CHOICE_LETTERS = "ABCD"
+
 
 def generate_item(
     skill_id: str, difficulty: Optional[str] = None, seed: Optional[int] = None
@@ -400,7 +403,7 @@ def generate_item(
     
     shuffled_choices = [text for _, text in choices_with_idx]
     solution_idx_after_shuffle = next(i for i, (orig_idx, _) in enumerate(choices_with_idx) if orig_idx == question["solution"])
-    solution_choice_id = chr(ord("A") + solution_idx_after_shuffle)
+    solution_choice_id = _CHOICE_LETTERS[solution_idx_after_shuffle]
     
     return {
         "item_id": item_id,
@@ -408,7 +411,7 @@ def generate_item(
         "difficulty": difficulty,
         "stem": question["stem"],
         "choices": [
-            {"id": chr(ord("A") + i), "text": text}
+            {"id": _CHOICE_LETTERS[i], "text": text}
             for i, text in enumerate(shuffled_choices)
         ],
         "solution_choice_id": solution_choice_id,
@@ -8,6 +8,17 @@ import unicodedata
 from typing import Tuple
 
 
+# Contract constants, built once rather than per call
+_REQUIRED_FIELDS = frozenset({"item_id", "skill_id", "difficulty", "stem", "choices", "solution_choice_id"})
+_CHOICE_IDS = ["A", "B", "C", "D"]
+_CHOICE_INDEX = {cid: i for i, cid in enumerate(_CHOICE_IDS)}
+
+
+def _normalize(text: str) -> str:
+    """Normalize text: NFKC, strip, lowercase."""
+    return unicodedata.normalize("NFKC", text).strip().lower()
+
+
 def validate_item(item: dict) -> Tuple[bool, str]:
     """
     Validate a generated item's structure per contract.
@@ -28,9 +39,8 @@ def validate_item(item: dict) -> Tuple[bool, str]:
     """
     # NOTE: Do not mutate `item`; validator must remain pure.
     
-    # Check required fields
-    required_fields = {"item_id", "skill_id", "difficulty", "stem", "choices", "solution_choice_id"}
-    if not required_fields.issubset(item.keys()):
+    # Check required fields (cheap guard before any per-choice work)
+    if not _REQUIRED_FIELDS.issubset(item.keys()):
         return (False, "missing_field")
     
     # Check stem (non-empty string)
@@ -52,32 +62,31 @@ def validate_item(item: dict) -> Tuple[bool, str]:
         return (False, "missing_field")
     
     # Check choice IDs are A,B,C,D in order
-    expected_ids = ["A", "B", "C", "D"]
     actual_ids = [c["id"] for c in choices]
-    if actual_ids != expected_ids:
+    if actual_ids != _CHOICE_IDS:
         return (False, "bad_choice_ids")
     
     # Check choice texts: non-empty and unique after normalization
-    def normalize(text: str) -> str:
-        """Normalize text: NFKC, strip, lowercase."""
-        return unicodedata.normalize("NFKC", text).strip().lower()
-    
     texts = [c["text"] for c in choices]
     if not all(isinstance(t, str) and t.strip() for t in texts):
         return (False, "bad_choice_ids")
     
-    normalized_texts = [normalize(t) for t in texts]
-    if len(normalized_texts) != len(set(normalized_texts)):
-        return (False, "duplicate_choice_text")
+    # Stop at the first repeat rather than normalizing every choice
+    seen = set()
+    for t in texts:
+        norm = _normalize(t)
+        if norm in seen:
+            return (False, "duplicate_choice_text")
+        seen.add(norm)
     
     # Check solution_choice_id is valid
     solution_id = item.get("solution_choice_id")
-    if solution_id not in expected_ids:
+    solution_idx = _CHOICE_INDEX.get(solution_id) if isinstance(solution_id, str) else None
+    if solution_idx is None:
         return (False, "invalid_solution_id")
     
     # Check solution_text consistency (if present)
     if "solution_text" in item and item["solution_text"] is not None:
-        solution_idx = expected_ids.index(solution_id)
         solution_choice_text = choices[solution_idx]["text"]
         if item["solution_text"] != solution_choice_text:
             return (False, "solution_text_mismatch")
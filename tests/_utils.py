@@ -16,20 +16,24 @@ _QUAD_RE = re.compile(
     re.VERBOSE | re.IGNORECASE
 )
 
+# Patterns used by parse_standard_form, compiled once at import.
+_EQ_RE = re.compile(r'y\s*=\s*(.+?)\.?\s*$')
+_BARE_X2_RE = re.compile(r'(^|[\s+-])x\^2')  # x^2 at start, after space, or after sign
+_COEFF_X_RE = re.compile(r'(\d)x(?!\^)')
+_TERMS_RE = re.compile(r'([+-]?\d+)\*x\^2\s*([+-])\s*(\d+)\*x\s*([+-])\s*(\d+)')
+
 def parse_standard_form(stem: str):
     """Parse standard form y = ax^2 + bx + c from a stem string.
     
     Returns tuple (a, b, c) or None if parse fails.
     Handles implicit a=1, various spacing, and Unicode minus signs.
     """
-    import re
-    
     # Normalize the stem
     s = norm_stem(stem).replace("−", "-")
     
     # Extract just the equation part (y = ...)
     # Look for "y = " and take everything after
-    eq_match = re.search(r'y\s*=\s*(.+?)\.?\s*$', s)
+    eq_match = _EQ_RE.search(s)
     if not eq_match:
         return None
     
@@ -40,16 +44,14 @@ def parse_standard_form(stem: str):
     # "2x^2 - 8x + 3" -> "2*x^2 - 8*x + 3"
     
     # First: insert implicit 1 for standalone x^2
-    eq = re.sub(r'^x\^2', '1*x^2', eq)  # Start of string
-    eq = re.sub(r'(\s)x\^2', r'\g<1>1*x^2', eq)  # After space
-    eq = re.sub(r'([-+])x\^2', r'\g<1>1*x^2', eq)  # After sign
+    eq = _BARE_X2_RE.sub(r'\g<1>1*x^2', eq)
     
     # Second: add * before x (not x^)
-    eq = re.sub(r'(\d)x(?!\^)', r'\g<1>*x', eq)
+    eq = _COEFF_X_RE.sub(r'\g<1>*x', eq)
     
     # Now the equation should be like: "1*x^2 - 4*x + 1" or "2*x^2 - 8*x + 3"
     # Match: [+-]? coeff*x^2 [+-] coeff*x [+-] constant
-    m = re.match(r'([+-]?\d+)\*x\^2\s*([+-])\s*(\d+)\*x\s*([+-])\s*(\d+)', eq)
+    m = _TERMS_RE.match(eq)
     
     if not m:
         return None
@@ -8,25 +8,10 @@ Response error envelope:
     HTTP 400 with JSON: {"error": "<code>", "message": "<human readable>"}
 """
 
-import sys
-import os
-
-# Add parent directories to path to enable imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
-
 import pytest
 from fastapi.testclient import TestClient
 
-# Import server - try both paths
-try:
-    from api.server import app
-except ModuleNotFoundError:
-    # Fallback: import from the file directly
-    import importlib.util
-    spec = importlib.util.spec_from_file_location("server", "api/server.py")
-    server = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(server)
-    app = server.app
+from api.server import app
 
 
 # ============================================================================
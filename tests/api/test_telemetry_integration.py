@@ -4,31 +4,16 @@ Phase 2d: Telemetry integration tests
 Tests verify that telemetry events are logged correctly on successful paths.
 """
 
-import os
 import json
 import time
 from pathlib import Path
 import tempfile
-import asyncio
-import sys
 from collections import defaultdict
 
-# Add parent directories to path to enable imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
-
 import pytest
 from fastapi.testclient import TestClient
 
-# Import server - try both paths
-try:
-    from api.server import app
-except ModuleNotFoundError:
-    # Fallback: import from the file directly
-    import importlib.util
-    spec = importlib.util.spec_from_file_location("server", "api/server.py")
-    server = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(server)
-    app = server.app
+from api.server import app
 
 
 @pytest.fixture
@@ -38,7 +23,7 @@ def temp_telemetry_dir():
         yield tmpdir
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
     """FastAPI test client."""
     return TestClient(app)
@@ -57,6 +42,21 @@ def read_jsonl_lines(filepath):
     return lines
 
 
+def wait_for_events(filepath, event=None, start=0, count=1, timeout=2.0):
+    """
+    Poll a JSONL file until `count` lines of `event` (any event if None) exist past `start`.
+
+    Telemetry is written by fire-and-forget tasks, so tests wait on the
+    condition instead of sleeping a fixed interval; gives up after `timeout`.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        lines = read_jsonl_lines(filepath)[start:]
+        if sum(1 for e in lines if event is None or e.get("event") == event) >= count:
+            return
+        time.sleep(0.01)
+
+
 class TestGenerateEventShape:
     """Test 1: generate event has correct shape."""
 
@@ -86,8 +86,8 @@ class TestGenerateEventShape:
         )
         assert response.status_code == 200
 
-        # Give telemetry a moment to flush (it uses create_task)
-        time.sleep(0.5)
+        # Wait for telemetry to flush (it uses create_task)
+        wait_for_events(str(log_file), "generate", start=old_lines)
 
         # Read telemetry log
         lines = read_jsonl_lines(str(log_file))
@@ -143,8 +143,8 @@ class TestGradeEventShape:
         )
         assert grade_response.status_code == 200
 
-        # Give telemetry a moment
-        time.sleep(0.5)
+        # Wait for telemetry to flush
+        wait_for_events(str(log_file), "grade", start=old_lines)
 
         # Read telemetry log (last line should be grade event)
         lines = read_jsonl_lines(str(log_file))
@@ -198,8 +198,8 @@ class TestCycleResetEvent:
             )
             assert response.status_code == 200
 
-        # Give telemetry time to flush
-        time.sleep(1.0)
+        # Wait for telemetry to flush
+        wait_for_events(str(log_file), "cycle_reset", count=old_reset_count + 1)
 
         # Read telemetry log
         lines = read_jsonl_lines(str(log_file))
@@ -241,6 +241,7 @@ class TestRotation:
         """
         log_file = Path("logs") / "telemetry.jsonl"
         rotate_dir = Path("logs") / "telemetry.rotate"
+        old_lines = len(read_jsonl_lines(str(log_file)))
         
         # Generate items
         for i in range(5):
@@ -254,7 +255,7 @@ class TestRotation:
             )
             assert response.status_code == 200
 
-        time.sleep(0.5)
+        wait_for_events(str(log_file), "generate", start=old_lines, count=5)
 
         # Check that telemetry directory structure is in place
         assert log_file.parent.exists(), "Telemetry directory should exist"
@@ -299,7 +300,7 @@ class TestTelemetrySchema:
         )
         assert r2.status_code == 200
 
-        time.sleep(0.5)
+        wait_for_events(str(log_file), start=old_lines, count=2)
 
         lines = read_jsonl_lines(str(log_file))
         new_events = lines[old_lines:]
@@ -335,7 +336,7 @@ class TestGoldenTelemetrySchema:
         )
         assert r.status_code == 200
 
-        time.sleep(0.3)
+        wait_for_events(str(log_file), "generate", start=old_count)
 
         lines = read_jsonl_lines(str(log_file))
         new_events = [e for e in lines[old_count:] if e.get("event") == "generate"]
@@ -458,9 +459,3 @@ class TestGoldenTelemetrySnapshot:
         assert event_counts["generate"] >= 6, "Golden should have ≥6 generate events"
         assert event_counts["grade"] >= 2, "Golden should have ≥2 grade events"
         assert event_counts["cycle_reset"] >= 1, "Golden should have ≥1 cycle_reset event"
-
-        # Summary (for debugging)
-        print(f"\n✅ Golden telemetry structure valid:")
-        print(f"   generate: {event_counts['generate']}")
-        print(f"   grade: {event_counts['grade']}")
-        print(f"   cycle_reset: {event_counts['cycle_reset']}")
@@ -5,26 +5,9 @@ Ensures that the manifest accurately reflects the template counts,
 so UI pool hints match reality.
 """
 
-import sys
-import os
-import pytest
-
-# Add repo root to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
-
-try:
-    from api.server import app
-except (ImportError, ModuleNotFoundError):
-    import importlib.util
-    spec = importlib.util.spec_from_file_location(
-        "api.server",
-        os.path.join(os.path.dirname(__file__), '../../api/server.py')
-    )
-    server_module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(server_module)
-    app = server_module.app
-
 from fastapi.testclient import TestClient
+
+from api.server import app
 from engine.templates import SKILL_TEMPLATES
 
 client = TestClient(app)
@@ -7,59 +7,67 @@ These tests ensure:
 3. All items have exactly 4 choices with valid solution indices
 """
 
+from collections import Counter
+
 import pytest
 
 from engine.templates import SKILL_TEMPLATES
 
 
+# One case per (skill, difficulty) pool so a bad pool fails on its own.
+_POOLS = [
+    pytest.param(skill, diff, items, id=f"{skill}:{diff}")
+    for skill, diffs in SKILL_TEMPLATES.items()
+    if isinstance(diffs, dict)
+    for diff, items in diffs.items()
+]
+
+
 def test_no_duplicate_skill_ids():
     """SKILL_TEMPLATES must be non-empty (keys are unique by dict definition)."""
     assert SKILL_TEMPLATES, "SKILL_TEMPLATES must not be empty"
+    for skill, diffs in SKILL_TEMPLATES.items():
+        assert isinstance(diffs, dict), f"{skill} diffs must be a dict"
 
 
-def test_no_duplicate_stems_within_pool():
+@pytest.mark.parametrize("skill,diff,items", _POOLS)
+def test_no_duplicate_stems_within_pool(skill, diff, items):
     """Within each (skill, difficulty), stems must be unique (no repeats)."""
-    for skill, diffs in SKILL_TEMPLATES.items():
-        assert isinstance(diffs, dict), f"{skill} diffs must be a dict"
-        
-        for diff, items in diffs.items():
-            stems = [i["stem"] for i in items]
-            
-            # Check for duplicates
-            if len(stems) != len(set(stems)):
-                duplicates = [s for s in set(stems) if stems.count(s) > 1]
-                pytest.fail(
-                    f"Duplicate stems in {skill}:{diff}:\n"
-                    f"  Duplicates: {duplicates}"
-                )
-
-
-def test_choices_are_4_and_solution_index_valid():
+    counts = Counter(i["stem"] for i in items)
+
+    # Check for duplicates
+    duplicates = [s for s, n in counts.items() if n > 1]
+    if duplicates:
+        pytest.fail(
+            f"Duplicate stems in {skill}:{diff}:\n"
+            f"  Duplicates: {duplicates}"
+        )
+
+
+@pytest.mark.parametrize("skill,diff,items", _POOLS)
+def test_choices_are_4_and_solution_index_valid(skill, diff, items):
     """All items must have exactly 4 choices with valid solution indices (0-3)."""
-    for skill, diffs in SKILL_TEMPLATES.items():
-        for diff, items in diffs.items():
-            for idx, item in enumerate(items):
-                # Check 4 choices
-                assert len(item["choices"]) == 4, (
-                    f"{skill}:{diff}[{idx}] must have exactly 4 choices, "
-                    f"got {len(item['choices'])}"
-                )
-                
-                # Check solution index is in range
-                assert 0 <= item["solution"] < 4, (
-                    f"{skill}:{diff}[{idx}] solution index {item['solution']} "
-                    f"out of range [0, 3]"
-                )
-
-
-def test_all_items_have_required_fields():
+    for idx, item in enumerate(items):
+        # Check 4 choices
+        assert len(item["choices"]) == 4, (
+            f"{skill}:{diff}[{idx}] must have exactly 4 choices, "
+            f"got {len(item['choices'])}"
+        )
+
+        # Check solution index is in range
+        assert 0 <= item["solution"] < 4, (
+            f"{skill}:{diff}[{idx}] solution index {item['solution']} "
+            f"out of range [0, 3]"
+        )
+
+
+@pytest.mark.parametrize("skill,diff,items", _POOLS)
+def test_all_items_have_required_fields(skill, diff, items):
     """All items must have stem, choices, solution, and rationale."""
     required_fields = {"stem", "choices", "solution", "rationale"}
-    
-    for skill, diffs in SKILL_TEMPLATES.items():
-        for diff, items in diffs.items():
-            for idx, item in enumerate(items):
-                missing = required_fields - set(item.keys())
-                assert not missing, (
-                    f"{skill}:{diff}[{idx}] missing fields: {missing}"
-                )
+
+    for idx, item in enumerate(items):
+        missing = required_fields - set(item.keys())
+        assert not missing, (
+            f"{skill}:{diff}[{idx}] missing fields: {missing}"
+        )
@@ -88,19 +88,19 @@ def test_golden_item_easy_seed_42(skill_id, golden_file):
         f"Full item mismatch.\nGenerated:\n{json.dumps(generated, indent=2)}\n\nGolden:\n{json.dumps(golden, indent=2)}"
 
 
-def test_all_golden_files_exist():
+@pytest.mark.parametrize("skill_id,golden_file", GOLDEN_CASES)
+def test_all_golden_files_exist(skill_id, golden_file):
     """Sanity check: verify all golden files are present."""
-    for skill_id, golden_file in GOLDEN_CASES:
-        golden_path = GOLDEN_DIR / golden_file
-        assert golden_path.exists(), f"Missing golden: {golden_path}"
+    golden_path = GOLDEN_DIR / golden_file
+    assert golden_path.exists(), f"Missing golden: {golden_path}"
 
 
-def test_golden_files_are_valid_json():
+@pytest.mark.parametrize("skill_id,golden_file", GOLDEN_CASES)
+def test_golden_files_are_valid_json(skill_id, golden_file):
     """Sanity check: verify all golden files are parseable JSON."""
-    for skill_id, golden_file in GOLDEN_CASES:
-        golden_path = GOLDEN_DIR / golden_file
-        with open(golden_path) as f:
-            data = json.load(f)
-        assert isinstance(data, dict), f"Golden {golden_file} is not a dict"
-        assert "item_id" in data, f"Golden {golden_file} missing item_id"
-        assert "choices" in data, f"Golden {golden_file} missing choices"
+    golden_path = GOLDEN_DIR / golden_file
+    with open(golden_path) as f:
+        data = json.load(f)
+    assert isinstance(data, dict), f"Golden {golden_file} is not a dict"
+    assert "item_id" in data, f"Golden {golden_file} missing item_id"
+    assert "choices" in data, f"Golden {golden_file} missing choices"
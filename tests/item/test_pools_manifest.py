@@ -1,24 +1,8 @@
 # tests/item/test_pools_manifest.py
 
-import sys
-import os
-import pytest
-
-# Add parent directories to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
-
 from fastapi.testclient import TestClient
 
-try:
-    from api.server import app
-except (ImportError, ModuleNotFoundError):
-    import importlib.util
-    spec = importlib.util.spec_from_file_location("api.server", 
-        os.path.join(os.path.dirname(__file__), '../../api/server.py'))
-    server_module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(server_module)
-    app = server_module.app
-
+from api.server import app
 from engine.templates import SKILL_TEMPLATES
 
 
@@ -1,9 +1,5 @@
 # tests/item/test_quadratics_math.py
 
-import math
-
-import pytest
-
 from engine.templates import SKILL_TEMPLATES, generate_item
 
 from tests._utils import parse_standard_form
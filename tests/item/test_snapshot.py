@@ -7,7 +7,6 @@ Locked after Phase-1 core is verified.
 
 import json
 from pathlib import Path
-import pytest
 from engine.templates import generate_item
 
 
@@ -4,7 +4,6 @@ Group 2: Validator correctness tests for engine.validators.validate_item()
 Tests verify that the validator correctly detects each contract violation.
 """
 
-import pytest
 from engine.validators import validate_item
 
 
@@ -15,7 +15,7 @@ Prints:
 import json
 import sys
 import statistics
-from collections import defaultdict
+from collections import Counter, defaultdict
 from pathlib import Path
 
 
@@ -28,12 +28,12 @@ def analyze(filepath: str) -> None:
         return
     
     # Counters
-    event_counts = defaultdict(int)
+    event_counts = Counter()
     stem_hashes = defaultdict(set)  # (skill, difficulty) -> set of stem_hashes
-    correct_counts = defaultdict(int)  # skill_id -> correct count
-    total_grades = defaultdict(int)  # skill_id -> total grades
+    correct_counts = Counter()  # skill_id -> correct count
+    total_grades = Counter()  # skill_id -> total grades
     latencies = defaultdict(list)  # event_type -> [latency_ms values]
-    cycle_resets = defaultdict(int)  # (skill, difficulty) -> reset count
+    cycle_resets = Counter()  # (skill, difficulty) -> reset count
     
     with open(path, "r") as f:
         for line_num, line in enumerate(f, 1):
@@ -47,11 +47,9 @@ def analyze(filepath: str) -> None:
             event_counts[event_type] += 1
             
             # Track latency
-            if "latency_ms" in event:
-                try:
-                    latencies[event_type].append(float(event["latency_ms"]))
-                except (TypeError, ValueError):
-                    pass
+            latency = event.get("latency_ms")
+            if isinstance(latency, (int, float)) and not isinstance(latency, bool):
+                latencies[event_type].append(float(latency))
             
             # Coverage: unique stems per (skill, difficulty)
             if event_type == "generate":
@@ -84,7 +82,7 @@ def analyze(filepath: str) -> None:
     
     # Event totals
     print("\nEvent Totals:")
-    total_events = sum(event_counts.values())
+    total_events = event_counts.total()
     for event_type in sorted(event_counts.keys()):
         count = event_counts[event_type]
         pct = 100 * count / total_events if total_events > 0 else 0
@@ -117,7 +115,7 @@ def analyze(filepath: str) -> None:
     # Cycle resets
     if cycle_resets:
         print("\nCycle Resets by Pool:")
-        total_resets = sum(cycle_resets.values())
+        total_resets = cycle_resets.total()
         for (skill, difficulty) in sorted(cycle_resets.keys()):
             count = cycle_resets[(skill, difficulty)]
             print(f"  {skill} {difficulty}: {count} reset(s)")
@@ -127,11 +125,12 @@ def analyze(filepath: str) -> None:
     if latencies:
         print("\nLatency (ms) by Event Type:")
         for event_type in sorted(latencies.keys()):
-            lats = latencies[event_type]
+            # Sort once: min/max are the ends, and median's own sort is then linear
+            lats = sorted(latencies[event_type])
             if len(lats) > 0:
                 print(f"  {event_type}:")
-                print(f"    min: {min(lats):.2f}")
-                print(f"    max: {max(lats):.2f}")
+                print(f"    min: {lats[0]:.2f}")
+                print(f"    max: {lats[-1]:.2f}")
                 print(f"    median: {statistics.median(lats):.2f}")
                 if len(lats) > 1:
                     print(f"    stdev: {statistics.stdev(lats):.2f}")